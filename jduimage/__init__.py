@@ -1,7 +1,10 @@
 from __future__ import annotations
 from typing import List
 
+import os
+
 import cv2 as cv
+import numpy as np
 
 from ._imageStructure import ImageStructure
 from ._generalMixin import GeneralMixin
@@ -12,6 +15,12 @@ from ._colorMixin import ColorMixin
 from ._outputMixin import OutputMixin
 from ._toClassifyMixin import ToClassifyMixin
 
+cv.setUseOptimized(True)
+
+_threads = os.environ.get("JDUIMAGE_CV_THREADS")
+if _threads is not None:
+    cv.setNumThreads(int(_threads))
+
 
 class Image(
     ImageStructure,
@@ -30,6 +39,17 @@ class Image(
     def __init__(self, input):
         super().__init__(input)
 
+    @staticmethod
+    def set_num_threads(n: int) -> None:
+        """Sets the number of threads OpenCV uses internally. Can also be set with the JDUIMAGE_CV_THREADS environment variable. A value of 1 is often faster on small images, where thread-dispatch overhead dominates the actual work.
+
+        Parameters
+        ----------
+        n: int
+            Number of threads. 0 disables threading, a negative value restores the default
+        """
+        cv.setNumThreads(n)
+
     def deepcopy(self) -> Image:
         """Creates a deep copy of the image, independant from the source.
 
@@ -38,6 +58,16 @@ class Image(
         Image
             Deepcopy of the input image
         """
+        return Image(self.data.copy())
+
+    def view(self) -> Image:
+        """Creates a shallow copy wrapping the same pixel buffer, for callers that only read or immediately reallocate the data. Mutating the view in place also mutates the source.
+
+        Returns
+        -------
+        Image
+            View on the input image
+        """
         return Image(self.data)
 
     def channels(self):
@@ -64,13 +94,12 @@ class Image(
         if alpha < 0 or alpha > 1:
             raise ValueError("Alpha must be in [0, 1]")
 
-        img1 = self.deepcopy()
-        img2 = other.deepcopy()
-
-        img1.to_BGR()
-        img2.to_BGR()
+        d1 = self.data if self.dim == 3 else cv.cvtColor(self.data, cv.COLOR_GRAY2BGR)
+        d2 = (
+            other.data if other.dim == 3 else cv.cvtColor(other.data, cv.COLOR_GRAY2BGR)
+        )
 
-        self.data = cv.addWeighted(img1.data, 1 - alpha, img2.data, alpha, 0.0)
+        self.data = cv.addWeighted(d1, 1 - alpha, d2, alpha, 0.0)
 
     def crop(self, tl: List[int], br: List[int], inplace: bool = True) -> None or Image:
         """Crops the image from top-left (tl) to bottom-right (br) corners.
@@ -83,6 +112,10 @@ class Image(
             Bottom right corner of the ROI (2 elements array)
         inplace: bool, optional
             flag to make to operation inplace (default is True)
+
+        Notes
+        -----
+        The result is a contiguous copy, not a view on the source data, so that downstream operations stay on the fast path.
         """
 
         if tl[0] < 0 or tl[1] < 0:
@@ -92,7 +125,7 @@ class Image(
         if tl[0] >= br[0] or tl[1] >= br[1]:
             raise ValueError("br must be bigger than tl")
 
-        cropped = self.data[tl[0] : br[0] + 1, tl[1] : br[1] + 1]
+        cropped = np.ascontiguousarray(self.data[tl[0] : br[0] + 1, tl[1] : br[1] + 1])
         if inplace:
             self.data = cropped
         else:
@@ -113,11 +146,17 @@ class Image(
             width of the cropped image
         inplace: bool, optional
             flag to make to operation inplace (default is True)
+
+        Notes
+        -----
+        The result is a contiguous copy, not a view on the source data, so that downstream operations stay on the fast path.
         """
         if tl[0] < 0 or tl[1] < 0:
             raise ValueError("Wrong tl")
 
-        cropped = self.data[tl[0] : tl[0] + height, tl[1] : tl[1] + width]
+        cropped = np.ascontiguousarray(
+            self.data[tl[0] : tl[0] + height, tl[1] : tl[1] + width]
+        )
         if inplace:
             self.data = cropped
         else:
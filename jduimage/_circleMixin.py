@@ -7,7 +7,14 @@ from math import asin, sqrt, pi
 
 class CircleMixin:
     def get_circle(
-        self, min: int = 0, max: int = 0, div: float = 1.0
+        self,
+        min: int = 0,
+        max: int = 0,
+        div: float = 1.0,
+        method: int = cv.HOUGH_GRADIENT_ALT,
+        param1: float = None,
+        param2: float = None,
+        minDist: float = 20,
     ) -> Tuple[List[float], float]:
         """Finds the biggest circle in the image, with a transformed HoughLine algorithm. Only works on 2D images.
 
@@ -19,6 +26,14 @@ class CircleMixin:
             Maximum radius (default is 0)
         div: float, optional
             Inverse of resize ratio for speed up (default is 1.0)
+        method: int, optional
+            Hough detection method. cv.HOUGH_GRADIENT is kept as a fallback (default is cv.HOUGH_GRADIENT_ALT)
+        param1: float, optional
+            Higher Canny threshold (default is 300 for HOUGH_GRADIENT_ALT, 20 otherwise)
+        param2: float, optional
+            Circle perfectness in [0.8, 1.0] for HOUGH_GRADIENT_ALT, accumulator threshold otherwise (default is 0.9, respectively 20)
+        minDist: float, optional
+            Minimum distance between detected centers (default is 20)
 
         Returns
         -------
@@ -30,16 +45,21 @@ class CircleMixin:
         if self.dim != 2:
             raise ValueError("Circle only on 2D images")
 
-        thumbnail = self.deepcopy()
+        if param1 is None:
+            param1 = 300 if method == cv.HOUGH_GRADIENT_ALT else 20
+        if param2 is None:
+            param2 = 0.9 if method == cv.HOUGH_GRADIENT_ALT else 20
+
+        thumbnail = self.view()
         thumbnail.resize("ratio", 1.0 / div)
 
         c = cv.HoughCircles(
             thumbnail.data,
-            cv.HOUGH_GRADIENT,
+            method,
             1,
-            20,
-            param1=20,
-            param2=20,
+            minDist,
+            param1=param1,
+            param2=param2,
             minRadius=int(min / div),
             maxRadius=int(max / div),
         )
@@ -101,17 +121,17 @@ class CircleMixin:
         angle_vec = np.arange(stop=2 * pi, step=asin(1 / precision_position))
         radii_vec = np.arange(start=max(radii), stop=min(radii), step=-1)
 
-        coses = np.array(
-            center[0] - np.outer(np.cos(angle_vec), radii_vec), dtype=np.uint16
+        mapx = (center[1] - np.sin(angle_vec)[None, :] * radii_vec[:, None]).astype(
+            np.float32
         )
-        sines = np.array(
-            center[1] - np.outer(np.sin(angle_vec), radii_vec), dtype=np.uint16
+        mapy = (center[0] - np.cos(angle_vec)[None, :] * radii_vec[:, None]).astype(
+            np.float32
         )
 
-        self.data = self.data[coses, sines].transpose(1, 0, 2)
+        self.data = cv.remap(self.data, mapx, mapy, cv.INTER_LINEAR)
 
     def filter_objects(self, min_size: int = 0, max_size: int = -1) -> None:
-        """Remove all objects in a given size range.
+        """Remove all objects in a given size range. Objects wrapping around the left/right borders are counted as one.
 
         Parameters
         ----------
@@ -121,50 +141,52 @@ class CircleMixin:
         max_size: int, optional
             Maximum size of the objects to keep (default is -1)
         """
-        concat = np.hstack(
-            (
-                self.data[:, self.width // 2 :],
-                self.data,
-                self.data[:, : self.width // 2],
-            )
-        )
-
         nb_components, labels, stats, _ = cv.connectedComponentsWithStats(
-            concat, connectivity=8
+            self.data, connectivity=8
         )
 
-        sizes = stats[1:, cv.CC_STAT_AREA]
-
-        nb_components = nb_components - 1
+        roots = _merge_wraparound(labels, nb_components)
+        sizes = np.bincount(
+            roots, weights=stats[:, cv.CC_STAT_AREA], minlength=nb_components
+        )[roots]
 
-        for i in range(0, nb_components):
-            if sizes[i] < min_size or (max_size != -1 and sizes[i] > max_size):
-                concat[labels == i + 1] = 0
+        lut = np.full(nb_components, 255, dtype=np.uint8)
+        lut[0] = 0
+        lut[sizes < min_size] = 0
+        if max_size != -1:
+            lut[sizes > max_size] = 0
 
-        self.data = concat[:, concat.shape[1] // 4 : 3 * concat.shape[1] // 4]
+        self.data = cv.bitwise_and(self.data, lut[labels])
 
     def filter_border2border(self, coef: float = 0.25) -> None:
-        """Removes all the objects that are smaller than coef*height of the image.
+        """Removes all the objects that are smaller than coef*height of the image. Objects wrapping around the left/right borders are counted as one.
 
         Parameters
         ----------
         coef: float, optional
             (default is 0.25)
         """
-        concat = np.hstack((self.data, self.data, self.data))
-
         nb_components, labels, stats, _ = cv.connectedComponentsWithStats(
-            concat, connectivity=8
+            self.data, connectivity=8
         )
 
-        heights = stats[1:, cv.CC_STAT_HEIGHT]
-        nb_components = nb_components - 1
+        roots = _merge_wraparound(labels, nb_components)
+
+        tops = stats[:, cv.CC_STAT_TOP]
+        bottoms = tops + stats[:, cv.CC_STAT_HEIGHT]
+
+        merged_tops = np.full(nb_components, self.height, dtype=np.int64)
+        merged_bottoms = np.zeros(nb_components, dtype=np.int64)
+        np.minimum.at(merged_tops, roots, tops)
+        np.maximum.at(merged_bottoms, roots, bottoms)
 
-        for i in range(0, nb_components):
-            if heights[i] < self.height * coef:
-                concat[labels == i + 1] = 0
+        heights = (merged_bottoms - merged_tops)[roots]
 
-        self.data = concat[:, concat.shape[1] // 3 : 2 * concat.shape[1] // 3]
+        lut = np.full(nb_components, 255, dtype=np.uint8)
+        lut[0] = 0
+        lut[heights < self.height * coef] = 0
+
+        self.data = cv.bitwise_and(self.data, lut[labels])
 
     def get_corners(self) -> np.ndarray:
         """Returns the corners of the image starting at (0, 0) in a clockwise order.
@@ -195,21 +217,41 @@ class CircleMixin:
         dst: np.ndarray
             Four destination position list
         """
-        if src.shape == (4, 2):
+        if src.shape != (4, 2):
             raise ValueError("src list needs to be 4x2")
-        if dst.shape == (4, 2):
+        if dst.shape != (4, 2):
             raise ValueError("dst list needs to be 4x2")
 
         M = cv.getPerspectiveTransform(src, dst)
 
-        channels = []
-        max_range = self.shape[2] if len(self.shape) == 3 else 1
-        for idx in range(0, max_range):
-            arr = cv.warpPerspective(
-                self.channel(idx).data, M, [self.width, self.height]
-            )
-            channels.append(arr)
+        self.data = cv.warpPerspective(self.data, M, (self.width, self.height))
+
+
+def _merge_wraparound(labels: np.ndarray, nb_components: int) -> np.ndarray:
+    """Merges connected components that touch both the left and right borders on the same row, as if the image wrapped around horizontally.
+
+    Parameters
+    ----------
+    labels: np.ndarray
+        Label image from cv.connectedComponentsWithStats
+    nb_components: int
+        Number of labels, background included
+
+    Returns
+    -------
+    np.ndarray
+        Per-label root index after union of wrap-around components
+    """
+    parent = np.arange(nb_components)
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
 
-        arr = np.stack(channels)
+    for left, right in set(zip(labels[:, 0], labels[:, -1])):
+        if left and right:
+            parent[find(left)] = find(right)
 
-        self.data = arr.swapaxes(0, 2).swapaxes(0, 1)
+    return np.array([find(i) for i in range(nb_components)])
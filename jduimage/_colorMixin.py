@@ -47,27 +47,17 @@ class ColorMixin:
 
     def to_8UC1(self) -> None:
         """Convert the image to 8UC1."""
-        if isinstance(self.data[0, 0], np.uint8):
+        if self.data.dtype == np.uint8:
             return
 
-        max_val = np.max(self.data)
-        min_val = np.min(self.data)
-
-        temp = (self.data - min_val) / (max_val - min_val) * 255.0
-
-        self.data = temp.astype(np.uint8)
+        self.data = cv.normalize(self.data, None, 0, 255, cv.NORM_MINMAX, cv.CV_8U)
 
     def to_16UC1(self) -> None:
         """Convert the image to 16UC1."""
-        if isinstance(self.data[0, 0], np.uint8):
+        if self.data.dtype == np.uint16:
             return
 
-        max_val = np.max(self.data)
-        min_val = np.min(self.data)
-
-        temp = (self.data - min_val) / (max_val - min_val) * 65535.0
-
-        self.data = temp.astype(np.uint16)
+        self.data = cv.normalize(self.data, None, 0, 65535, cv.NORM_MINMAX, cv.CV_16U)
 
     def kmeans(
         self, K: int, maxiter: int = 10, epsilon: float = 1.0, equalize: bool = False
@@ -91,7 +81,16 @@ class ColorMixin:
 
         Z = np.float32(Z)
         criteria = (cv.TERM_CRITERIA_EPS + cv.TERM_CRITERIA_MAX_ITER, maxiter, epsilon)
-        _, label, center = cv.kmeans(Z, K, None, criteria, 10, cv.KMEANS_PP_CENTERS)
+
+        stride = max(1, Z.shape[0] // 50000)
+        Z_samp = np.ascontiguousarray(Z[::stride])
+
+        _, label, center = cv.kmeans(Z_samp, K, None, criteria, 3, cv.KMEANS_PP_CENTERS)
+
+        if stride > 1:
+            _, label = cv.batchDistance(
+                Z, center, cv.CV_32F, K=1, normType=cv.NORM_L2SQR
+            )
 
         if equalize:
             self.data = label.flatten().reshape(self.shape[:2]).astype(np.uint8)
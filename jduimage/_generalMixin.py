@@ -1,6 +1,7 @@
 import cv2 as cv
 import numpy as np
 
+from functools import lru_cache
 from typing import List
 
 
@@ -14,8 +15,22 @@ class GeneralMixin:
             Channels index to access
         """
         if self.dim != 2:
-            channels = cv.split(self.data)
-            self.data = channels[c]
+            self.data = np.ascontiguousarray(self.data[..., c])
+
+    def channel_view(self, c: int) -> np.ndarray:
+        """Returns one channel as a zero-copy view on the image, for read-only access. The view is not contiguous; use channel for a contiguous copy.
+
+        Parameters
+        ----------
+        c : int
+            Channels index to access
+
+        Returns
+        -------
+        np.ndarray
+            Strided view on the requested channel
+        """
+        return self.data[..., c]
 
     def split(self, direction: str = "h", position: int or str = "mid") -> None:
         """Split the image.
@@ -56,7 +71,7 @@ class GeneralMixin:
         if self.dim != 2:
             raise ValueError("Negation only on 2D images")
 
-        self.data = ~self.data
+        self.data = cv.bitwise_not(self.data)
 
     def blur(self, size: int = 5, method: str = "gauss") -> None:
         """Blurs the image. The method and filter size can be chosen.
@@ -93,7 +108,8 @@ class GeneralMixin:
         sigma: float
             standard deviation of the kernel
         """
-        self.data = cv.GaussianBlur(self.data, (size, size), sigma)
+        kernel = _gauss1d(size, sigma)
+        self.data = cv.sepFilter2D(self.data, -1, kernel, kernel)
 
     def resize(self, param: str, value: float, inter: int = cv.INTER_AREA) -> None:
         """Resizes the image. When changing height (respectively width), width (respectively height) change so that the ratio stays the same.
@@ -172,12 +188,11 @@ class GeneralMixin:
 
         self.data = cv.equalizeHist(self.data.astype(np.uint8))
 
-        hist = np.cumsum(np.histogram(self.data, 255)[0])
-        lowest_value = np.where((rate * hist[-1]) <= hist)[0][0]
-        highest_value = np.where(((1 - rate) * hist[-1]) >= hist)[0][-1]
+        hist = np.cumsum(cv.calcHist([self.data], [0], None, [256], [0, 256]).ravel())
+        lowest_value = np.uint8(np.where((rate * hist[-1]) <= hist)[0][0])
+        highest_value = np.uint8(np.where(((1 - rate) * hist[-1]) >= hist)[0][-1])
 
-        self.data[self.data < lowest_value] = lowest_value
-        self.data[self.data > highest_value] = highest_value
+        np.clip(self.data, lowest_value, highest_value, out=self.data)
 
     def distance_transform(self) -> None:
         """Computes distances transformation, i.e. for each black pixel, computes the shortest distances to a white pixel. Only works on 2D images."""
@@ -187,3 +202,22 @@ class GeneralMixin:
         self.data = cv.distanceTransform(self.data, cv.DIST_L2, 3)
         cv.normalize(self.data, self.data, 0, 1, cv.NORM_MINMAX)
         self.data = np.uint8(self.data * 255)
+
+
+@lru_cache(maxsize=16)
+def _gauss1d(size: int, sigma: float) -> np.ndarray:
+    """Returns a cached 1D gaussian kernel, applied separably on rows and columns.
+
+    Parameters
+    ----------
+    size: int
+        size of the kernel
+    sigma: float
+        standard deviation of the kernel
+
+    Returns
+    -------
+    np.ndarray
+        Column vector holding the kernel coefficients
+    """
+    return cv.getGaussianKernel(size, sigma)
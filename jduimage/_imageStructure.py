@@ -25,6 +25,19 @@ class ImageStructure:
         elif isinstance(input, np.ndarray):
             self.data = self.__convert_array(input)
 
+    @property
+    def data(self) -> np.ndarray:
+        """Underlying pixel buffer."""
+        return self._data
+
+    @data.setter
+    def data(self, array: np.ndarray) -> None:
+        if not array.flags["C_CONTIGUOUS"]:
+            array = np.ascontiguousarray(array)
+
+        self._data = array
+        self._dim = array.ndim
+
     @property
     def shape(self) -> List[int]:
         """Shape of the image."""
@@ -42,8 +55,8 @@ class ImageStructure:
 
     @property
     def dim(self) -> int:
-        """Number of dimensions of the image."""
-        return len(self.shape)
+        """Number of dimensions of the image, cached on assignment so that the guards sprinkled over the mixins stay cheap."""
+        return self._dim
 
     def __load_image(self, path: str) -> np.ndarray:
         """Loads the image from a file, as a color image (BGR).
@@ -1,6 +1,10 @@
 import cv2 as cv
 import numpy as np
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Tuple
+
 
 class MorphologicalMixin:
     def sharpen(self) -> None:
@@ -11,12 +15,14 @@ class MorphologicalMixin:
         filter = np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])
         self.data = cv.filter2D(self.data, -1, filter)
 
-    def open(self, size: int = (5, 5), element: int = cv.MORPH_ELLIPSE) -> None:
+    def open(
+        self, size: Tuple[int, int] = (5, 5), element: int = cv.MORPH_ELLIPSE
+    ) -> None:
         """Performs morphological opening on the image. Only works on 2D images.
 
         Parameters
         ----------
-        size: int, optional
+        size: tuple of int, optional
             Size of the kernel (default is (5, 5))
         element: int, optional
             Structural element (default is cv.MORPH_ELLIPSE)
@@ -24,32 +30,35 @@ class MorphologicalMixin:
         if self.dim != 2:
             raise ValueError("Only on 2D images")
 
-        kernel = cv.getStructuringElement(element, size)
+        kernel = _strel(element, size)
         self.data = cv.morphologyEx(self.data, cv.MORPH_OPEN, kernel)
 
-    def close(self, size: int = (5, 5), element: int = cv.MORPH_ELLIPSE) -> None:
+    def close(
+        self, size: Tuple[int, int] = (5, 5), element: int = cv.MORPH_ELLIPSE
+    ) -> None:
         """Performs morphological closing on the image. Only works on 2D images.
 
         Parameters
         ----------
-        size: int, optional
-            Size of the kernel (default is (5, 5)
-            )
+        size: tuple of int, optional
+            Size of the kernel (default is (5, 5))
         element: int, optional
             Structural element (default is cv.MORPH_ELLIPSE)
         """
         if self.dim != 2:
             raise ValueError("Only on 2D images")
 
-        kernel = cv.getStructuringElement(element, size)
+        kernel = _strel(element, size)
         self.data = cv.morphologyEx(self.data, cv.MORPH_CLOSE, kernel)
 
-    def dilate(self, size: int = (5, 5), element: int = cv.MORPH_ELLIPSE) -> None:
+    def dilate(
+        self, size: Tuple[int, int] = (5, 5), element: int = cv.MORPH_ELLIPSE
+    ) -> None:
         """Performs morphological dilatation on the image. Only works on 2D images.
 
         Parameters
         ----------
-        size: int, optional
+        size: tuple of int, optional
             Size of the kernel (default is (5, 5))
         element: int, optional
             Structural element (default is cv.MORPH_ELLIPSE)
@@ -57,23 +66,25 @@ class MorphologicalMixin:
         if self.dim != 2:
             raise ValueError("Only on 2D images")
 
-        kernel = cv.getStructuringElement(element, size)
+        kernel = _strel(element, size)
         self.data = cv.morphologyEx(self.data, cv.MORPH_DILATE, kernel)
 
-    def erode(self, size: int = (5, 5), element: int = cv.MORPH_ELLIPSE) -> None:
+    def erode(
+        self, size: Tuple[int, int] = (5, 5), element: int = cv.MORPH_ELLIPSE
+    ) -> None:
         """Performs morphological erosion on the image. Only works on 2D images.
 
         Parameters
         ----------
-        size: int, optional
-            Size of the kernel (default is (5,5))
+        size: tuple of int, optional
+            Size of the kernel (default is (5, 5))
         element: int, optional
             Structural element (default is cv.MORPH_ELLIPSE)
         """
         if self.dim != 2:
             raise ValueError("Only on 2D images")
 
-        kernel = cv.getStructuringElement(element, size)
+        kernel = _strel(element, size)
         self.data = cv.morphologyEx(self.data, cv.MORPH_ERODE, kernel)
 
     def tophat(self, size: int = 5, element: int = cv.MORPH_ELLIPSE) -> None:
@@ -89,7 +100,7 @@ class MorphologicalMixin:
         if self.dim != 2:
             raise ValueError("Only on 2D images")
 
-        kernel = cv.getStructuringElement(element, (size, size))
+        kernel = _strel(element, size)
         self.data = cv.morphologyEx(self.data, cv.MORPH_TOPHAT, kernel)
 
     def algebric_open(self, size: int = 5, step: int = 5) -> None:
@@ -105,15 +116,7 @@ class MorphologicalMixin:
         if self.dim != 2:
             raise ValueError("Only on 2D images")
 
-        result = np.zeros(self.shape, dtype=np.uint8)
-
-        for a in range(0, 180, step):
-            kernel = line_strel(size=size, angle=a)
-
-            temp = cv.morphologyEx(self.data, cv.MORPH_OPEN, kernel).astype(np.uint8)
-            result = np.maximum(result, temp)
-
-        self.data = result
+        self.data = self.__algebric(cv.MORPH_OPEN, size, step)
 
     def algebric_dilate(self, size: int = 5, step: int = 5) -> None:
         """Performs morphological algebric dilatation on the image. Only works on 2D images.
@@ -128,15 +131,33 @@ class MorphologicalMixin:
         if self.dim != 2:
             raise ValueError("Only on 2D images")
 
-        result = np.zeros(self.shape, dtype=np.uint8)
+        self.data = self.__algebric(cv.MORPH_DILATE, size, step)
+
+    def __algebric(self, operation: int, size: int, step: int) -> np.ndarray:
+        """Runs a morphological operation with rotated linear elements and reduces the results with a pixel-wise maximum. The per-angle operations are independent, so they run in a thread pool (OpenCV releases the GIL).
 
-        for a in range(0, 180, step):
-            kernel = line_strel(size=size, angle=a)
+        Parameters
+        ----------
+        operation: int
+            OpenCV morphological operation code
+        size: int
+            Structural element size
+        step: int
+            Angle step
 
-            temp = cv.morphologyEx(self.data, cv.MORPH_DILATE, kernel).astype(np.uint8)
-            result = np.maximum(result, temp)
+        Returns
+        -------
+        np.ndarray
+            Reduced result over all angles
+        """
+        kernels = [line_strel(size=size, angle=a) for a in range(0, 180, step)]
 
-        self.data = result
+        with ThreadPoolExecutor() as executor:
+            results = executor.map(
+                lambda kernel: cv.morphologyEx(self.data, operation, kernel), kernels
+            )
+
+        return np.maximum.reduce(list(results))
 
     def blackhat(self, size: int = 5, element: int = cv.MORPH_ELLIPSE) -> None:
         """Performs morphological blackhat on the image. Only works on 2D images.
@@ -151,23 +172,22 @@ class MorphologicalMixin:
         if self.dim != 2:
             raise ValueError("Only on 2D images")
 
-        kernel = cv.getStructuringElement(element, (size, size))
+        kernel = _strel(element, size)
         self.data = cv.morphologyEx(self.data, cv.MORPH_BLACKHAT, kernel)
 
-    def gabor(self) -> None:
-        """Applies gabor filter to the image."""
-        ksize = 21
-        thetas = [-45]
+    def gabor(self, thetas: Tuple[float] = (-45,)) -> None:
+        """Applies gabor filter to the image.
 
-        filters = []
-        for a in thetas:
-            kernel = cv.getGaborKernel([ksize, ksize], 40, a, 25, 1)
-            filters.append(kernel)
+        Parameters
+        ----------
+        thetas: tuple of float, optional
+            Filter orientations in degrees (default is (-45,))
+        """
+        result = cv.filter2D(self.data, -1, _gabor_kernel(21, 40, thetas[0], 25, 1))
 
-        result = np.zeros(self.shape, dtype=np.uint8)
-        for kernel in filters:
-            imgfiltered = cv.filter2D(self.data, -1, kernel)
-            result = np.maximum(result, imgfiltered)
+        for theta in thetas[1:]:
+            filtered = cv.filter2D(self.data, -1, _gabor_kernel(21, 40, theta, 25, 1))
+            cv.max(filtered, result, dst=result)
 
         self.data = result
 
@@ -205,12 +225,45 @@ def line_strel(size: int, angle: float) -> np.ndarray:
     if size % 2 != 1:
         raise ValueError("Size must be odd")
 
-    line = np.zeros((size, size))
-    line[line.height // 2, :] = 1
+    kernel = np.zeros((size, size), dtype=np.uint8)
+
+    r = size // 2
+    dx = int(round(r * np.cos(np.deg2rad(angle))))
+    dy = int(round(r * np.sin(np.deg2rad(angle))))
+
+    cv.line(kernel, (r - dx, r - dy), (r + dx, r + dy), 255, 1)
+
+    return kernel
+
+
+def _strel(element: int, size: int or Tuple[int, int]) -> np.ndarray:
+    """Returns a structuring element, cached across calls so that batch pipelines do not rebuild the same kernel over and over.
+
+    Parameters
+    ----------
+    element: int
+        Structural element shape
+    size: int or tuple of int
+        Size of the kernel. An int is expanded to a square kernel
+
+    Returns
+    -------
+    np.ndarray
+        Structuring element
+    """
+    if isinstance(size, int):
+        size = (size, size)
+
+    return _cached_strel(element, tuple(size))
+
 
-    center = (size // 2, size // 2)
+@lru_cache(maxsize=64)
+def _cached_strel(element: int, size: Tuple[int, int]) -> np.ndarray:
+    return cv.getStructuringElement(element, size)
 
-    tform = cv.getRotationMatrix2D(center, angle, 1)
-    kernel = cv.warpAffine(line, tform, line.shape)
 
-    return (kernel * 255).astype(np.uint8)
+@lru_cache(maxsize=16)
+def _gabor_kernel(
+    ksize: int, sigma: float, theta: float, lambd: float, gamma: float
+) -> np.ndarray:
+    return cv.getGaborKernel((ksize, ksize), sigma, theta, lambd, gamma)
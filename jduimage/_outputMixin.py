@@ -1,5 +1,11 @@
 import cv2 as cv
+
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List
+
+_VALID_EXTS = frozenset({"jpg", "jpeg", "png"})
 
 
 class OutputMixin:
@@ -16,11 +22,16 @@ class OutputMixin:
             Width of the image for display (default is 0)
         """
 
-        display = self.deepcopy()
+        if height == 0 and width == 0:
+            cv.imshow(label, self.data)
+            cv.waitKey(0)
+            return
+
+        display = self.view()
 
         if height != 0:
             display.resize("height", height)
-        elif width != 0:
+        else:
             display.resize("width", width)
 
         cv.imshow(label, display.data)
@@ -35,14 +46,26 @@ class OutputMixin:
         path: str
             Path to output image. Can be absolute or relative. Recognised file types are {"jpg","jpeg","png"}
         """
-        if path.split(".")[-1] not in ["jpg", "jpeg", "png"]:
+        p = Path(path)
+
+        if p.suffix.lower().lstrip(".") not in _VALID_EXTS:
             raise ValueError("Unrecognised image file type")
 
-        folder = "."
-        substrings = path.replace("\\", "/").split("/")
-        folder = "/".join(substrings[0:-1])
+        if p.parent != Path("."):
+            p.parent.mkdir(parents=True, exist_ok=True)
 
-        if folder and not Path(folder).exists():
-            Path(folder).mkdir(parents=True, exist_ok=True)
+        cv.imwrite(str(p), self.data)
 
-        cv.imwrite(path, self.data)
+    @staticmethod
+    def save_many(paths: List[str], images: List) -> None:
+        """Saves a batch of images in parallel, one worker per core. Image encoding and disk writes release the GIL, so the saves overlap.
+
+        Parameters
+        ----------
+        paths: list of str
+            Paths to the output images
+        images: list of Image
+            Images to save, matching the paths one to one
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(lambda image, path: image.save(path), images, paths))
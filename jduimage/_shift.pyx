@@ -0,0 +1,32 @@
+# cython: boundscheck=False, wraparound=False
+from libc.stdint cimport uint8_t
+from libc.string cimport memcpy
+
+
+cpdef void shift2d(
+    const uint8_t[:, ::1] src, uint8_t[:, ::1] dst, Py_ssize_t offset, int axis
+):
+    """Cyclic shift of a 2D uint8 image along the given axis, written as plain memcpy calls over contiguous spans. offset must already be reduced modulo the axis length and be non-zero.
+
+    Parameters
+    ----------
+    src: uint8_t[:, ::1]
+        Source image
+    dst: uint8_t[:, ::1]
+        Destination buffer, same shape as src
+    offset: Py_ssize_t
+        Shift amount along the axis
+    axis: int
+        0 to shift rows, 1 to shift columns
+    """
+    cdef Py_ssize_t height = src.shape[0]
+    cdef Py_ssize_t width = src.shape[1]
+    cdef Py_ssize_t y
+
+    if axis == 0:
+        memcpy(&dst[0, 0], &src[offset, 0], (height - offset) * width)
+        memcpy(&dst[height - offset, 0], &src[0, 0], offset * width)
+    else:
+        for y in range(height):
+            memcpy(&dst[y, 0], &src[y, offset], width - offset)
+            memcpy(&dst[y, width - offset], &src[y, 0], offset)
@@ -1,31 +1,88 @@
 import cv2 as cv
 import numpy as np
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from ._shift import shift2d
+except ImportError:
+    shift2d = None
+
 
 class ToClassifyMixin:
-    def integral(self) -> None:
-        """Computes the integral of the image."""
+    def integral(self, n_threads: int = None) -> None:
+        """Computes the integral of the image, with uint32 accumulation (exact for 8-bit input). The row prefix-sums of independent horizontal bands run in a thread pool (NumPy releases the GIL), followed by one serial column pass.
+
+        Parameters
+        ----------
+        n_threads: int, optional
+            Number of worker threads for the row pass (default is os.cpu_count())
+
+        Notes
+        -----
+        The stored sums are raw pixel counts. Callers that want the sums of the previous 0-1 normalisation can multiply lazily by self._integral_scale.
+        """
         if self.dim == 3:
             self.BGR_to_GRAY()
 
-        self.data = self.data.astype(np.float32) / 255.0
+        if n_threads is None:
+            n_threads = os.cpu_count()
+
+        self._integral_scale = 1.0 / 255.0
+
+        if n_threads <= 1:
+            # cv.integral has no unsigned sum depth; the int32 result wraps on
+            # large bright images, but the bit pattern is the exact uint32 sum.
+            self.data = cv.integral(self.data, sdepth=cv.CV_32S).view(np.uint32)
+            return
+
+        out = np.zeros((self.height + 1, self.width + 1), dtype=np.uint32)
+        out[1:, 1:] = self.data
 
-        self.data = cv.integral(self.data)
+        bands = np.array_split(out[1:], n_threads)
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            list(executor.map(lambda band: np.cumsum(band, axis=1, out=band), bands))
+
+        np.cumsum(out, axis=0, out=out)
+
+        self.data = out
 
     def vertical_shift(self, offset: int) -> None:
-        """Shift the image verticaly by a given offset."""
-        new_indexes = (np.arange(self.width) + offset) % self.width
+        """Shift the image verticaly by a given offset. The shift is cyclic: columns leaving on one side come back on the other."""
+        offset = offset % self.width
+        if offset == 0:
+            return
 
-        if self.dim == 3:
-            self.data = self.data[:, new_indexes, :]
-        elif self.dim == 2:
-            self.data = self.data[:, new_indexes]
+        if self.__can_shift_compiled():
+            dst = np.empty_like(self.data)
+            shift2d(self.data, dst, offset, 1)
+            self.data = dst
+            return
+
+        self.data = np.concatenate(
+            (self.data[:, offset:], self.data[:, :offset]), axis=1
+        )
 
     def horizontal_shift(self, offset: int) -> None:
-        """Shift the image horizontaly by a given offset."""
-        new_indexes = (np.arange(self.height) + offset) % self.height
+        """Shift the image horizontaly by a given offset. The shift is cyclic: rows leaving on one side come back on the other."""
+        offset = offset % self.height
+        if offset == 0:
+            return
 
-        if self.dim == 3:
-            self.data = self.data[new_indexes, :, :]
-        elif self.dim == 2:
-            self.data = self.data[new_indexes, :]
+        if self.__can_shift_compiled():
+            dst = np.empty_like(self.data)
+            shift2d(self.data, dst, offset, 0)
+            self.data = dst
+            return
+
+        self.data = np.concatenate((self.data[offset:], self.data[:offset]), axis=0)
+
+    def __can_shift_compiled(self) -> bool:
+        """Tells whether the compiled shift extension can handle the image: the extension must be built and the image must be a contiguous 2D uint8 buffer. NumPy slicing remains as the fallback."""
+        return (
+            shift2d is not None
+            and self.dim == 2
+            and self.data.dtype == np.uint8
+            and self.data.flags["C_CONTIGUOUS"]
+        )
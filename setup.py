@@ -1,8 +1,19 @@
 import setuptools
 
+from pathlib import Path
+
 with open("README.md", "r") as fh:
     long_description = fh.read()
 
+ext_modules = []
+if Path("jduimage/_shift.pyx").exists():
+    try:
+        from Cython.Build import cythonize
+
+        ext_modules = cythonize(["jduimage/_shift.pyx"])
+    except ImportError:
+        pass
+
 
 setuptools.setup(
     name="jduimage",
@@ -15,6 +26,7 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/jeandemeusy/jdu-image",
     packages=["jduimage"],
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",